@@ -6,13 +6,23 @@ Core agent interaction functions for running autonomous coding sessions.
 """
 
 import asyncio
+import reprlib
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from claude_code_sdk import ClaudeSDKClient
-
-from client import create_client
+from claude_code_sdk import (
+    AssistantMessage,
+    ClaudeSDKClient,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from client import create_client_options
+from git_operations import ensure_git_initialized, get_git_status
 from logger import activity, start_heartbeat, stop_heartbeat, start_tool, end_tool
 from mcp_diagnostics import diagnose_stuck_tool
 from progress import print_session_header, print_progress_summary, is_linear_initialized
@@ -23,30 +33,143 @@ from prompts import get_initializer_prompt, get_coding_prompt, copy_spec_to_proj
 AUTO_CONTINUE_DELAY_SECONDS = 3
 TOOL_WARNING_THRESHOLD = 300  # 5 minutes
 TOOL_TIMEOUT_SECONDS = 600  # 10 minutes
+RESULT_SCAN_CHARS = 2048  # Prefix of tool results checked for "blocked"
+TEXT_FLUSH_INTERVAL_SECONDS = 0.05  # Coalesce streamed text for up to 50ms
+TOOL_INPUT_PREVIEW_CHARS = 200  # Max length of displayed tool input
+
+# Bounded formatter for tool inputs: stops walking large payloads early
+_input_repr = reprlib.Repr()
+_input_repr.maxstring = 80
+_input_repr.maxother = TOOL_INPUT_PREVIEW_CHARS
+_input_repr.maxdict = 6
+_input_repr.maxlist = 6
+_input_repr.maxlevel = 3
+
+# Streamed text waiting to be written (see _emit_text)
+_text_buffer: list[str] = []
+_last_text_flush = 0.0
 
 
-async def tool_watchdog(tool_name: str, timeout_seconds: int = TOOL_TIMEOUT_SECONDS):
+def _short_repr(obj, limit: int = TOOL_INPUT_PREVIEW_CHARS) -> str:
     """
-    Watchdog that warns if a tool takes too long.
+    Format obj for display without formatting all of a large payload.
 
     Args:
-        tool_name: Name of the tool being monitored
-        timeout_seconds: Timeout threshold in seconds
+        obj: Object to format (typically a tool input dict)
+        limit: Maximum length of the returned string, excluding "..."
+
+    Returns:
+        Possibly truncated representation of obj
     """
-    await asyncio.sleep(timeout_seconds)
+    text = _input_repr.repr(obj)
+    if len(text) > limit:
+        return text[:limit] + "..."
+    return text
 
-    # Tool has exceeded timeout - print warning and diagnostics
-    print(f"\n⚠ WARNING: Tool '{tool_name}' has been running for >{timeout_seconds}s", flush=True)
-    print(f"   This may indicate a hung MCP server or API timeout", flush=True)
-    print(f"   Consider interrupting (Ctrl+C) and checking:", flush=True)
-    print(f"   - Linear API status: https://status.linear.app", flush=True)
-    print(f"   - MCP server logs", flush=True)
-    print(f"   - Network connectivity", flush=True)
 
-    # Print tool-specific diagnostics
-    suggestions = diagnose_stuck_tool(tool_name, timeout_seconds)
-    for suggestion in suggestions:
-        print(f"   {suggestion}", flush=True)
+def _emit_text(text: str, force: bool = False) -> None:
+    """
+    Buffer streamed text and write it out in batches.
+
+    Text is flushed when forced, when it contains a newline, or when
+    TEXT_FLUSH_INTERVAL_SECONDS have passed since the last flush, so a
+    fast token stream becomes a few larger writes instead of one per token.
+    Callers force a flush at the end of each message.
+
+    Args:
+        text: Text to emit (may be empty when only forcing a flush)
+        force: Flush immediately regardless of timing
+    """
+    global _last_text_flush
+
+    if text:
+        _text_buffer.append(text)
+
+    now = time.monotonic()
+    if force or "\n" in text or now - _last_text_flush >= TEXT_FLUSH_INTERVAL_SECONDS:
+        if _text_buffer:
+            print("".join(_text_buffer), end="", flush=True)
+            _text_buffer.clear()
+        _last_text_flush = now
+
+
+@lru_cache(maxsize=64)
+def _diagnose_stuck_tool(tool_name: str, duration: float) -> tuple[str, ...]:
+    """Memoized diagnose_stuck_tool(); suggestions depend only on the arguments."""
+    return tuple(diagnose_stuck_tool(tool_name, duration))
+
+
+# Tool currently monitored by tool_watchdog (None when no tool is running)
+_watched_tool: Optional[str] = None
+_watched_tool_start = 0.0
+_watched_tool_changed: Optional[asyncio.Event] = None
+
+
+def _watch_tool(tool_name: Optional[str]) -> None:
+    """
+    Point the tool watchdog at a new tool, or clear it with None.
+
+    Args:
+        tool_name: Name of the tool that just started, or None when it finished
+    """
+    global _watched_tool, _watched_tool_start
+
+    _watched_tool = tool_name
+    _watched_tool_start = time.monotonic()
+    if _watched_tool_changed is not None:
+        _watched_tool_changed.set()
+
+
+async def tool_watchdog(timeout_seconds: int = TOOL_TIMEOUT_SECONDS):
+    """
+    Long-lived watchdog that warns if the current tool takes too long.
+
+    A single task runs for the whole agent run and is woken through
+    _watch_tool() whenever a tool starts or finishes, instead of
+    spawning a new sleeping task per tool call.
+
+    Args:
+        timeout_seconds: Timeout threshold in seconds
+    """
+    global _watched_tool_changed
+
+    _watched_tool_changed = asyncio.Event()
+
+    while True:
+        tool_name = _watched_tool
+        if tool_name is None:
+            # Idle until a tool starts
+            await _watched_tool_changed.wait()
+            _watched_tool_changed.clear()
+            continue
+
+        remaining = timeout_seconds - (time.monotonic() - _watched_tool_start)
+        try:
+            await asyncio.wait_for(_watched_tool_changed.wait(), timeout=max(0.0, remaining))
+            _watched_tool_changed.clear()
+            continue
+        except asyncio.TimeoutError:
+            pass
+
+        # Tool has exceeded timeout - print warning and diagnostics in one write
+        lines = [
+            f"\n⚠ WARNING: Tool '{tool_name}' has been running for >{timeout_seconds}s",
+            "   This may indicate a hung MCP server or API timeout",
+            "   Consider interrupting (Ctrl+C) and checking:",
+            "   - Linear API status: https://status.linear.app",
+            "   - MCP server logs",
+            "   - Network connectivity",
+        ]
+
+        # Add tool-specific diagnostics
+        for suggestion in _diagnose_stuck_tool(tool_name, timeout_seconds):
+            lines.append(f"   {suggestion}")
+
+        print("\n".join(lines), flush=True)
+
+        # Warn only once per tool call
+        await _watched_tool_changed.wait()
+        _watched_tool_changed.clear()
 
 
 async def run_agent_session(
@@ -68,77 +191,81 @@ async def run_agent_session(
         - "error" if an error occurred
     """
     try:
-        # Send the query with activity tracking
-        with activity("Sending prompt to Claude"):
-            print("Sending prompt to Claude Agent SDK...\n")
-            await client.query(message)
+        # Send the query (returns once written; the response loop is tracked below)
+        print("Sending prompt to Claude Agent SDK...\n")
+        await client.query(message)
 
         # Collect response text and show tool use
-        response_text = ""
+        response_chunks: list[str] = []
         current_tool = None
         tool_start_time = None
-        watchdog_task = None
+
+        # Bind hot-loop constants as locals
+        warn_threshold = TOOL_WARNING_THRESHOLD
+        scan_chars = RESULT_SCAN_CHARS
 
         with activity("Processing agent response"):
             async for msg in client.receive_response():
-                msg_type = type(msg).__name__
-
                 # Handle AssistantMessage (text and tool use)
-                if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                if isinstance(msg, AssistantMessage):
                     for block in msg.content:
-                        block_type = type(block).__name__
+                        if isinstance(block, TextBlock):
+                            response_chunks.append(block.text)
+                            _emit_text(block.text)
+                        elif isinstance(block, ToolUseBlock):
+                            _emit_text("", force=True)
 
-                        if block_type == "TextBlock" and hasattr(block, "text"):
-                            response_text += block.text
-                            print(block.text, end="", flush=True)
-                        elif block_type == "ToolUseBlock" and hasattr(block, "name"):
                             # Record tool start
                             current_tool = block.name
-                            tool_start_time = time.time()
+                            tool_start_time = time.monotonic()
 
                             # Start activity tracking and watchdog
                             start_tool(current_tool)
-                            watchdog_task = asyncio.create_task(tool_watchdog(current_tool, TOOL_TIMEOUT_SECONDS))
+                            _watch_tool(current_tool)
 
-                            print(f"\n[Tool: {block.name}]", flush=True)
-                            if hasattr(block, "input"):
-                                input_str = str(block.input)
-                                if len(input_str) > 200:
-                                    print(f"   Input: {input_str[:200]}...", flush=True)
-                                else:
-                                    print(f"   Input: {input_str}", flush=True)
+                            print(
+                                f"\n[Tool: {block.name}]\n   Input: {_short_repr(block.input)}",
+                                flush=True,
+                            )
+
+                    # Don't hold text until the next message, which may be
+                    # minutes away (e.g. while a large tool input is written)
+                    _emit_text("", force=True)
 
-                # Handle UserMessage (tool results)
-                elif msg_type == "UserMessage" and hasattr(msg, "content"):
+                # Handle UserMessage (tool results); plain-string content
+                # carries no tool results, so skip walking it char by char
+                elif isinstance(msg, UserMessage) and not isinstance(msg.content, str):
                     for block in msg.content:
-                        block_type = type(block).__name__
+                        if isinstance(block, ToolResultBlock):
+                            _emit_text("", force=True)
 
-                        if block_type == "ToolResultBlock":
-                            # Cancel watchdog when tool completes
-                            if watchdog_task and not watchdog_task.done():
-                                watchdog_task.cancel()
+                            # Stop watching when tool completes
+                            _watch_tool(None)
 
                             # Calculate tool duration and show result
                             duration = None
-                            if tool_start_time:
-                                duration = time.time() - tool_start_time
+                            if tool_start_time is not None:
+                                duration = time.monotonic() - tool_start_time
                                 tool_start_time = None
                                 current_tool = None
 
-                            result_content = getattr(block, "content", "")
-                            is_error = getattr(block, "is_error", False)
+                            result_content = block.content
+                            if not isinstance(result_content, str):
+                                result_content = str(result_content)
+                            is_error = block.is_error
 
                             # Check if command was blocked by security hook
-                            if "blocked" in str(result_content).lower():
+                            # (block messages are short, so only scan the head)
+                            if "blocked" in result_content[:scan_chars].lower():
                                 print(f"   [BLOCKED] {result_content}", flush=True)
                             elif is_error:
                                 # Show errors (truncated)
-                                error_str = str(result_content)[:500]
+                                error_str = result_content[:500]
                                 print(f"   [Error] {error_str}", flush=True)
                             else:
                                 # Tool succeeded - show duration
-                                if duration and duration > TOOL_WARNING_THRESHOLD:
-                                    print(f"   ⚠ Tool took {duration:.1f}s (>{TOOL_WARNING_THRESHOLD}s threshold)", flush=True)
+                                if duration and duration > warn_threshold:
+                                    print(f"   ⚠ Tool took {duration:.1f}s (>{warn_threshold}s threshold)", flush=True)
                                 elif duration:
                                     print(f"   [Done in {duration:.1f}s]", flush=True)
                                 else:
@@ -147,10 +274,13 @@ async def run_agent_session(
                             # End tool tracking
                             end_tool()
 
+            _emit_text("", force=True)
             print("\n" + "-" * 70 + "\n")
-            return "continue", response_text
+            return "continue", "".join(response_chunks)
 
     except Exception as e:
+        _watch_tool(None)
+        _emit_text("", force=True)
         print(f"Error during agent session: {e}")
         return "error", str(e)
 
@@ -191,8 +321,7 @@ async def run_autonomous_agent(
         print()
 
         # Ensure git is initialized before first session
-        from git_operations import ensure_git_initialized
-        git_success, git_msg = ensure_git_initialized(project_dir)
+        git_success, git_msg = await asyncio.to_thread(ensure_git_initialized, project_dir)
         if git_success:
             print(f"✓ Git initialized: {git_msg}")
         else:
@@ -212,8 +341,14 @@ async def run_autonomous_agent(
         print("Continuing existing project (Linear initialized)")
         print_progress_summary(project_dir)
 
-    # Start heartbeat for long-running operations
+    # Build client options and prompts once; each session still gets a fresh client
+    client_options = create_client_options(project_dir, model)
+    initializer_prompt = get_initializer_prompt() if is_first_run else None
+    coding_prompt = get_coding_prompt()
+
+    # Start heartbeat and tool watchdog for long-running operations
     start_heartbeat()
+    watchdog_task = asyncio.create_task(tool_watchdog(TOOL_TIMEOUT_SECONDS))
 
     # Main loop
     iteration = 0
@@ -232,14 +367,14 @@ async def run_autonomous_agent(
             print_session_header(iteration, is_first_run)
 
             # Create client (fresh context)
-            client = create_client(project_dir, model)
+            client = ClaudeSDKClient(options=client_options)
 
             # Choose prompt based on session type
             if is_first_run:
-                prompt = get_initializer_prompt()
+                prompt = initializer_prompt
                 is_first_run = False  # Only use initializer once
             else:
-                prompt = get_coding_prompt()
+                prompt = coding_prompt
 
             # Run session with async context manager
             async with client:
@@ -247,8 +382,7 @@ async def run_autonomous_agent(
 
             # Verify git state after session
             print("\n[Verifying git state...]")
-            from git_operations import get_git_status
-            git_status = get_git_status(project_dir)
+            git_status = await asyncio.to_thread(get_git_status, project_dir)
             if git_status['initialized']:
                 if git_status['uncommitted_changes']:
                     print("⚠ Uncommitted changes detected")
@@ -261,24 +395,29 @@ async def run_autonomous_agent(
             else:
                 print("⚠ Git not initialized")
 
+            # No need to wait after the final iteration
+            is_last_iteration = bool(max_iterations) and iteration >= max_iterations
+
             # Handle status
             if status == "continue":
-                print(f"\nAgent will auto-continue in {AUTO_CONTINUE_DELAY_SECONDS}s...")
-                print_progress_summary(project_dir)
-                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+                if not is_last_iteration:
+                    print(f"\nAgent will auto-continue in {AUTO_CONTINUE_DELAY_SECONDS}s...")
+                # Git state was just verified above
+                print_progress_summary(project_dir, include_git=False)
 
             elif status == "error":
                 print("\nSession encountered an error")
-                print("Will retry with a fresh session...")
-                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+                if not is_last_iteration:
+                    print("Will retry with a fresh session...")
 
-            # Small delay between sessions
-            if max_iterations is None or iteration < max_iterations:
+            # Single delay between sessions
+            if not is_last_iteration:
+                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
                 print("\nPreparing next session...\n")
-                await asyncio.sleep(1)
     finally:
-        # Cleanup heartbeat on exit
+        # Cleanup heartbeat and watchdog on exit
         stop_heartbeat()
+        watchdog_task.cancel()
 
     # Final summary
     print("\n" + "=" * 70)
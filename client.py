@@ -65,16 +65,19 @@ BUILTIN_TOOLS = [
 ]
 
 
-def create_client(project_dir: Path, model: str) -> ClaudeSDKClient:
+def create_client_options(project_dir: Path, model: str) -> ClaudeCodeOptions:
     """
-    Create a Claude Agent SDK client with multi-layered security.
+    Build Claude Agent SDK options with multi-layered security.
+
+    Writes the security settings file into the project directory. The
+    returned options can be reused to create a fresh client per session.
 
     Args:
         project_dir: Directory for the project
         model: Claude model to use
 
     Returns:
-        Configured ClaudeSDKClient
+        Configured ClaudeCodeOptions
 
     Security layers (defense in depth):
     1. Sandbox - OS-level bash command isolation prevents filesystem escape
@@ -136,34 +139,48 @@ def create_client(project_dir: Path, model: str) -> ClaudeSDKClient:
     print("   - MCP servers: puppeteer (browser automation), linear (project management)")
     print()
 
-    return ClaudeSDKClient(
-        options=ClaudeCodeOptions(
-            model=model,
-            system_prompt="You are an expert full-stack developer building a production-quality web application. You use Linear for project management and tracking all your work.",
-            allowed_tools=[
-                *BUILTIN_TOOLS,
-                *PUPPETEER_TOOLS,
-                *LINEAR_TOOLS,
-            ],
-            mcp_servers={
-                "puppeteer": {"command": "npx", "args": ["puppeteer-mcp-server"]},
-                # Linear MCP with Streamable HTTP transport (recommended over SSE)
-                # See: https://linear.app/docs/mcp
-                "linear": {
-                    "type": "http",
-                    "url": "https://mcp.linear.app/mcp",
-                    "headers": {
-                        "Authorization": f"Bearer {linear_api_key}"
-                    }
+    return ClaudeCodeOptions(
+        model=model,
+        system_prompt="You are an expert full-stack developer building a production-quality web application. You use Linear for project management and tracking all your work.",
+        allowed_tools=[
+            *BUILTIN_TOOLS,
+            *PUPPETEER_TOOLS,
+            *LINEAR_TOOLS,
+        ],
+        mcp_servers={
+            "puppeteer": {"command": "npx", "args": ["puppeteer-mcp-server"]},
+            # Linear MCP with Streamable HTTP transport (recommended over SSE)
+            # See: https://linear.app/docs/mcp
+            "linear": {
+                "type": "http",
+                "url": "https://mcp.linear.app/mcp",
+                "headers": {
+                    "Authorization": f"Bearer {linear_api_key}"
                 }
-            },
-            hooks={
-                "PreToolUse": [
-                    HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
-                ],
-            },
-            max_turns=1000,
-            cwd=str(project_dir.resolve()),
-            settings=str(settings_file.resolve()),  # Use absolute path
-        )
+            }
+        },
+        hooks={
+            "PreToolUse": [
+                HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
+            ],
+        },
+        max_turns=1000,
+        cwd=str(project_dir.resolve()),
+        settings=str(settings_file.resolve()),  # Use absolute path
     )
+
+
+def create_client(project_dir: Path, model: str) -> ClaudeSDKClient:
+    """
+    Create a Claude Agent SDK client with multi-layered security.
+
+    Args:
+        project_dir: Directory for the project
+        model: Claude model to use
+
+    Returns:
+        Configured ClaudeSDKClient
+
+    See create_client_options() for the security configuration.
+    """
+    return ClaudeSDKClient(options=create_client_options(project_dir, model))
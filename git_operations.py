@@ -8,14 +8,167 @@ All git commands execute via subprocess and pass through bash security hooks.
 This module provides:
 - Git repository initialization with verification
 - Standardized commits with Linear issue tracking
-- Status checking for session verification
+- Status checking for session verification (optionally for many projects at once)
 - Remote repository setup for GitHub integration
+
+Optionally, operations can run in-process through pygit2 (libgit2 bindings)
+instead of spawning git. Install pygit2 and set GIT_USE_PYGIT2=1 to enable;
+otherwise (or if pygit2 is unavailable) the subprocess path is used.
 """
 
+import asyncio
+import os
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Use the in-process pygit2 backend only when explicitly enabled and installed.
+# pygit2 is slow to import, so it is only loaded when requested.
+pygit2 = None
+if os.environ.get("GIT_USE_PYGIT2") == "1":
+    try:
+        import pygit2
+    except ImportError:
+        pass
+USE_PYGIT2 = pygit2 is not None
+
+# create_commit in a single shell process: check for git, stage, skip if
+# nothing is staged, commit (message from $COMMIT_MSG, --quiet skips the
+# diffstat summary, errors to stderr) and print the new hash.
+# Exit codes identify the failing step.
+_COMMIT_SCRIPT = (
+    'command -v git >/dev/null || exit 127\n'
+    'git add . || exit 3\n'
+    'if git diff --cached --quiet; then echo NOCHANGES; exit 0; fi\n'
+    'git commit --quiet -m "$COMMIT_MSG" 1>&2 || exit 4\n'
+    'git rev-parse HEAD || true\n'
+)
+_COMMIT_SCRIPT_ADD_FAILED = 3
+_COMMIT_SCRIPT_COMMIT_FAILED = 4
+_SHELL_COMMAND_NOT_FOUND = 127
+
+# setup_remote_and_probe in a single shell process: check for git and .git,
+# print the current branch, then print an existing origin URL or add origin
+# ($REMOTE_URL) and print the verified URL. Exit codes identify the outcome.
+_REMOTE_SETUP_SCRIPT = (
+    'command -v git >/dev/null || exit 127\n'
+    '[ -e .git ] || exit 3\n'
+    'branch=$(git symbolic-ref --short -q HEAD 2>/dev/null'
+    ' || git rev-parse --abbrev-ref HEAD 2>/dev/null) || branch=\n'
+    'printf "%s\\n" "$branch"\n'
+    'if url=$(git remote get-url origin 2>/dev/null); then printf "%s\\n" "$url"; exit 4; fi\n'
+    'git remote add origin "$REMOTE_URL" || exit 5\n'
+    'git remote get-url origin || exit 6\n'
+)
+_REMOTE_SCRIPT_NOT_A_REPO = 3
+_REMOTE_SCRIPT_EXISTS = 4
+_REMOTE_SCRIPT_ADD_FAILED = 5
+_REMOTE_SCRIPT_VERIFY_FAILED = 6
+
+# get_git_status fields that depend only on HEAD and refs, cached per repo
+# as {resolved project_dir: (ref_state, {field: value})}
+_REF_STATUS_KEYS = ('last_commit_hash', 'last_commit_message')
+_status_cache: dict[Path, tuple[tuple, dict]] = {}
+
+
+def _ref_state(git_dir: Path) -> Optional[tuple]:
+    """
+    Snapshot the files that determine the current branch and commit.
+
+    Returns HEAD's contents plus (mtime, inode) of HEAD, the ref it points
+    to and packed-refs. git replaces ref files atomically on update, so any
+    commit, checkout or gc changes this tuple.
+
+    Args:
+        git_dir: Path to the .git directory
+
+    Returns:
+        Hashable snapshot, or None if HEAD can't be read
+    """
+    head_file = git_dir / "HEAD"
+    try:
+        head = head_file.read_text().strip()
+    except OSError:
+        return None
+
+    paths = [head_file, git_dir / "packed-refs"]
+    if head.startswith("ref: "):
+        paths.append(git_dir / head[len("ref: "):])
+
+    state = [head]
+    for path in paths:
+        try:
+            st = os.stat(path)
+            state.append((st.st_mtime_ns, st.st_ino))
+        except OSError:
+            state.append(None)
+    return tuple(state)
+
+
+@lru_cache(maxsize=None)
+def _git_executable() -> str:
+    """Absolute path of the git executable, or "git" if it isn't on PATH."""
+    return shutil.which("git") or "git"
+
+
+def _git(args: list[str], cwd: str, timeout: float, **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run a git command for the repository at cwd.
+
+    All git subprocesses go through here. The command is started as
+    `<abs path to git> -C <cwd> ...` with close_fds=False rather than with
+    cwd=..., which lets CPython launch it with posix_spawn instead of
+    fork+exec. Descriptors opened by Python are non-inheritable by default,
+    so close_fds=False doesn't leak them into git.
+
+    Args:
+        args: git arguments (without the leading "git")
+        cwd: Repository directory
+        timeout: Timeout in seconds
+        **kwargs: Passed to subprocess.run (stdout, stderr, text, ...)
+
+    Returns:
+        Completed process
+
+    Raises:
+        FileNotFoundError: If git is not installed
+        subprocess.TimeoutExpired: If the command exceeds timeout
+    """
+    return subprocess.run(
+        [_git_executable(), "-C", cwd, *args],
+        close_fds=False,
+        timeout=timeout,
+        **kwargs
+    )
+
+
+def _first_nonempty(result: subprocess.CompletedProcess) -> str:
+    """
+    Return a failed git command's stderr, or its stdout if stderr is empty.
+
+    Output captured as bytes is only decoded here, i.e. on the error path.
+    Streams that weren't captured (None) are skipped.
+
+    Args:
+        result: Completed git process
+
+    Returns:
+        Stripped error text (empty if the command printed nothing)
+    """
+    for output in (result.stderr, result.stdout):
+        if isinstance(output, bytes):
+            output = output.decode("utf-8", "replace")
+        if output and output.strip():
+            return output.strip()
+    return ""
+
+
+def _invalidate_status_cache(project_dir: Path) -> None:
+    """Drop cached get_git_status fields after modifying the repository."""
+    _status_cache.pop(project_dir.resolve(), None)
+
 
 def ensure_git_initialized(project_dir: Path) -> tuple[bool, str]:
     """
@@ -38,29 +191,33 @@ def ensure_git_initialized(project_dir: Path) -> tuple[bool, str]:
             print(f"Git ready: {msg}")
     """
     git_dir = project_dir / ".git"
+    cwd = str(project_dir)
 
-    # Check if already initialized
-    if git_dir.exists() and git_dir.is_dir():
+    # Check if already initialized (single stat; a .git file is a worktree)
+    if os.path.exists(git_dir):
         return True, "Repository already initialized"
 
+    if USE_PYGIT2:
+        return _pygit2_init(project_dir)
+
     # Try to initialize
     try:
-        result = subprocess.run(
-            ["git", "init"],
-            cwd=str(project_dir),
-            capture_output=True,
-            text=True,
+        result = _git(
+            ["init"],
+            cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=10
         )
 
         if result.returncode == 0:
             # Verify .git was created
-            if git_dir.exists():
+            if os.path.isdir(git_dir):
                 return True, "Repository initialized successfully"
             else:
                 return False, "git init succeeded but .git directory not found"
         else:
-            error_msg = result.stderr.strip() or result.stdout.strip()
+            error_msg = _first_nonempty(result)
             return False, f"git init failed: {error_msg}"
 
     except FileNotFoundError:
@@ -101,57 +258,80 @@ def get_git_status(project_dir: Path) -> dict:
         'branch': ''
     }
 
-    # Check if git is initialized
+    # Check if git is initialized (single stat; a .git file is a worktree)
     git_dir = project_dir / ".git"
-    if not (git_dir.exists() and git_dir.is_dir()):
+    if not os.path.exists(git_dir):
         return status
 
     status['initialized'] = True
 
+    if USE_PYGIT2:
+        return _pygit2_status(project_dir, status)
+
+    # The last commit only changes when HEAD or the refs do; reuse it while
+    # those files are untouched. Branch and working tree are always checked.
+    cwd = str(project_dir)
+    cache_key = project_dir.resolve()
+    ref_state = _ref_state(git_dir)
+    cached = _status_cache.get(cache_key)
+
     try:
-        # Get current branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=str(project_dir),
+        # Get current branch and check for uncommitted changes in one call
+        # (tracked files only; untracked files don't count as changes)
+        result = _git(
+            ["status", "--porcelain=v2", "--branch", "--untracked-files=no", "-z"],
+            cwd,
             capture_output=True,
             text=True,
             timeout=5
         )
+        unborn = False
         if result.returncode == 0:
-            status['branch'] = result.stdout.strip()
+            for entry in result.stdout.split("\0"):
+                if entry.startswith("# branch.head "):
+                    branch = entry[len("# branch.head "):]
+                    status['branch'] = "HEAD" if branch == "(detached)" else branch
+                elif entry == "# branch.oid (initial)":
+                    unborn = True
+                elif entry and not entry.startswith("# "):
+                    status['uncommitted_changes'] = True
+        else:
+            status['uncommitted_changes'] = True
+
+        # No commits yet: any file in the working tree, untracked included,
+        # is uncommitted work
+        if unborn and not status['uncommitted_changes']:
+            result = _git(
+                ["status", "--porcelain", "--untracked-files=normal", "-z"],
+                cwd,
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            status['uncommitted_changes'] = result.returncode != 0 or bool(result.stdout)
 
-        # Check for uncommitted changes
-        # git diff-index returns 0 if clean, 1 if dirty
-        result = subprocess.run(
-            ["git", "diff-index", "--quiet", "HEAD", "--"],
-            cwd=str(project_dir),
-            capture_output=True,
-            timeout=5
-        )
-        # returncode 1 means changes exist
-        status['uncommitted_changes'] = (result.returncode != 0)
+        if ref_state is not None and cached is not None and cached[0] == ref_state:
+            status.update(cached[1])
+            return status
 
-        # Get last commit info
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%H"],
-            cwd=str(project_dir),
+        # Get last commit hash and message
+        result = _git(
+            ["log", "-1", "--format=%H%x00%s"],
+            cwd,
             capture_output=True,
             text=True,
             timeout=5
         )
         if result.returncode == 0 and result.stdout.strip():
-            status['last_commit_hash'] = result.stdout.strip()
-
-            # Get commit message
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%s"],
-                cwd=str(project_dir),
-                capture_output=True,
-                text=True,
-                timeout=5
+            commit_hash, _, commit_message = result.stdout.strip().partition("\0")
+            status['last_commit_hash'] = commit_hash
+            status['last_commit_message'] = commit_message.strip()
+
+        if ref_state is not None:
+            _status_cache[cache_key] = (
+                ref_state,
+                {key: status[key] for key in _REF_STATUS_KEYS},
             )
-            if result.returncode == 0:
-                status['last_commit_message'] = result.stdout.strip()
 
     except subprocess.TimeoutExpired:
         # Return partial status on timeout
@@ -163,6 +343,50 @@ def get_git_status(project_dir: Path) -> dict:
     return status
 
 
+async def get_git_status_many(project_dirs: list[Path], max_concurrent: int = 32) -> list[dict]:
+    """
+    Get git status for several project directories concurrently.
+
+    Each get_git_status call runs in a worker thread; at most
+    max_concurrent run at once.
+
+    Args:
+        project_dirs: Paths to project directories
+        max_concurrent: Maximum number of concurrent status checks
+
+    Returns:
+        List of status dicts (see get_git_status), in the order of project_dirs
+
+    Example:
+        statuses = await get_git_status_many([Path("./a"), Path("./b")])
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def check(project_dir: Path) -> dict:
+        async with semaphore:
+            return await asyncio.to_thread(get_git_status, project_dir)
+
+    return await asyncio.gather(*(check(project_dir) for project_dir in project_dirs))
+
+
+def get_git_status_many_sync(project_dirs: list[Path], max_concurrent: int = 32) -> list[dict]:
+    """
+    Synchronous wrapper around get_git_status_many().
+
+    Must not be called from a running event loop; use
+    `await get_git_status_many(...)` there instead.
+
+    Args:
+        project_dirs: Paths to project directories
+        max_concurrent: Maximum number of concurrent status checks
+
+    Returns:
+        List of status dicts, in the order of project_dirs
+    """
+    return asyncio.run(get_git_status_many(project_dirs, max_concurrent))
+
+
+@lru_cache(maxsize=128)
 def commit_format_with_issue(
     message: str,
     issue_id: Optional[str] = None,
@@ -172,6 +396,8 @@ def commit_format_with_issue(
     """
     Format commit message with Linear issue information.
 
+    Results are memoized; the function is pure and all arguments are strings.
+
     Args:
         message: Main commit message (first line)
         issue_id: Linear issue ID (e.g., "TIB-57")
@@ -245,25 +471,42 @@ def create_commit(
         if success:
             print(f"Committed: {hash}")
     """
+    _invalidate_status_cache(project_dir)
+
+    if USE_PYGIT2:
+        return _pygit2_commit(
+            project_dir,
+            commit_format_with_issue(message, issue_id, issue_title, details),
+        )
+
+    if os.name != "nt":
+        return _create_commit_batched(
+            project_dir,
+            commit_format_with_issue(message, issue_id, issue_title, details),
+        )
+
+    cwd = str(project_dir)
+
     try:
         # Stage all changes
-        result = subprocess.run(
-            ["git", "add", "."],
-            cwd=str(project_dir),
-            capture_output=True,
-            text=True,
+        result = _git(
+            ["add", "."],
+            cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=30
         )
 
         if result.returncode != 0:
-            error = result.stderr.strip() or result.stdout.strip()
+            error = _first_nonempty(result)
             return False, "", f"git add failed: {error}"
 
         # Check if there's anything to commit
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--quiet"],
-            cwd=str(project_dir),
-            capture_output=True,
+        result = _git(
+            ["diff", "--cached", "--quiet"],
+            cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=10
         )
 
@@ -275,22 +518,22 @@ def create_commit(
         commit_msg = commit_format_with_issue(message, issue_id, issue_title, details)
 
         # Create commit
-        result = subprocess.run(
-            ["git", "commit", "-m", commit_msg],
-            cwd=str(project_dir),
-            capture_output=True,
-            text=True,
+        result = _git(
+            ["commit", "--quiet", "-m", commit_msg],
+            cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=30
         )
 
         if result.returncode != 0:
-            error = result.stderr.strip() or result.stdout.strip()
+            error = _first_nonempty(result)
             return False, "", f"git commit failed: {error}"
 
         # Get the commit hash
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=str(project_dir),
+        result = _git(
+            ["rev-parse", "HEAD"],
+            cwd,
             capture_output=True,
             text=True,
             timeout=5
@@ -311,6 +554,49 @@ def create_commit(
         return False, "", f"Unexpected error: {str(e)}"
 
 
+def _create_commit_batched(project_dir: Path, commit_msg: str) -> tuple[bool, str, str]:
+    """
+    Run the create_commit steps in one shell process instead of four.
+
+    Args:
+        project_dir: Path to project directory
+        commit_msg: Fully formatted commit message
+
+    Returns:
+        Same as create_commit
+    """
+    try:
+        result = subprocess.run(
+            _COMMIT_SCRIPT,
+            shell=True,
+            cwd=str(project_dir),
+            env={**os.environ, "COMMIT_MSG": commit_msg},
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+    except subprocess.TimeoutExpired:
+        return False, "", "git command timed out"
+    except Exception as e:
+        return False, "", f"Unexpected error: {str(e)}"
+
+    if result.returncode == _SHELL_COMMAND_NOT_FOUND:
+        return False, "", "git command not found - please install git"
+    if result.returncode == _COMMIT_SCRIPT_ADD_FAILED:
+        return False, "", f"git add failed: {result.stderr.strip()}"
+    if result.returncode == _COMMIT_SCRIPT_COMMIT_FAILED:
+        return False, "", f"git commit failed: {result.stderr.strip()}"
+    if result.returncode != 0:
+        return False, "", f"Unexpected error: {result.stderr.strip()}"
+
+    output = result.stdout.strip()
+    if output == "NOCHANGES":
+        return True, "", "No changes to commit"
+
+    # Empty if the commit succeeded but the hash couldn't be read
+    return True, output, ""
+
+
 def setup_remote(project_dir: Path, remote_url: str) -> tuple[bool, str]:
     """
     Set up git remote (origin) for the repository.
@@ -333,12 +619,20 @@ def setup_remote(project_dir: Path, remote_url: str) -> tuple[bool, str]:
             print(msg)
             # Now you can: git push -u origin main
     """
+    _invalidate_status_cache(project_dir)
+
+    if USE_PYGIT2:
+        return _pygit2_setup_remote(project_dir, remote_url)
+
+    cwd = str(project_dir)
+
     try:
         # Check if remote already exists
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=str(project_dir),
-            capture_output=True,
+        result = _git(
+            ["remote", "get-url", "origin"],
+            cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=5
         )
@@ -351,23 +645,24 @@ def setup_remote(project_dir: Path, remote_url: str) -> tuple[bool, str]:
                 return False, f"Remote 'origin' already exists with different URL: {existing_url}"
 
         # Add the remote
-        result = subprocess.run(
-            ["git", "remote", "add", "origin", remote_url],
-            cwd=str(project_dir),
-            capture_output=True,
-            text=True,
+        result = _git(
+            ["remote", "add", "origin", remote_url],
+            cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=10
         )
 
         if result.returncode != 0:
-            error = result.stderr.strip() or result.stdout.strip()
+            error = _first_nonempty(result)
             return False, f"Failed to add remote: {error}"
 
         # Verify it was added
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=str(project_dir),
-            capture_output=True,
+        result = _git(
+            ["remote", "get-url", "origin"],
+            cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=5
         )
@@ -387,3 +682,270 @@ def setup_remote(project_dir: Path, remote_url: str) -> tuple[bool, str]:
         return False, "git command not found - please install git"
     except Exception as e:
         return False, f"Unexpected error: {str(e)}"
+
+
+def setup_remote_and_probe(project_dir: Path, remote_url: str) -> dict:
+    """
+    Check the repository and set up the origin remote in one step.
+
+    Combines the initialization/branch check of get_git_status() with
+    setup_remote(). On POSIX this runs as a single shell process instead of
+    one git process per step.
+
+    Args:
+        project_dir: Path to project directory
+        remote_url: GitHub remote URL (e.g., https://github.com/user/repo.git)
+
+    Returns:
+        Dictionary with:
+        {
+            'initialized': bool - True if .git exists
+            'branch': str - Current branch name (empty if unknown)
+            'success': bool - True if origin is set to remote_url
+            'message': str - Success confirmation or error details
+        }
+
+    Example:
+        result = setup_remote_and_probe(
+            Path("./my_project"),
+            "https://github.com/user/repo.git"
+        )
+        if result['success']:
+            print(f"git push -u origin {result['branch']}")
+    """
+    if USE_PYGIT2 or os.name == "nt":
+        status = get_git_status(project_dir)
+        result = {
+            'initialized': status['initialized'],
+            'branch': status['branch'],
+            'success': False,
+            'message': f"{project_dir} is not a git repository",
+        }
+        if status['initialized']:
+            result['success'], result['message'] = setup_remote(project_dir, remote_url)
+        return result
+
+    _invalidate_status_cache(project_dir)
+    result = {'initialized': True, 'branch': '', 'success': False, 'message': ''}
+
+    try:
+        process = subprocess.run(
+            _REMOTE_SETUP_SCRIPT,
+            shell=True,
+            cwd=str(project_dir),
+            env={**os.environ, "REMOTE_URL": remote_url},
+            capture_output=True,
+            text=True,
+            timeout=20
+        )
+    except subprocess.TimeoutExpired:
+        result['message'] = "git command timed out"
+        return result
+    except Exception as e:
+        result['message'] = f"Unexpected error: {str(e)}"
+        return result
+
+    lines = process.stdout.splitlines()
+    result['branch'] = lines[0].strip() if lines else ""
+    url = lines[1].strip() if len(lines) > 1 else ""
+
+    if process.returncode == 0:
+        if url == remote_url:
+            result['success'] = True
+            result['message'] = f"Remote 'origin' configured successfully: {remote_url}"
+        else:
+            result['message'] = f"Remote added but URL mismatch: {url}"
+    elif process.returncode == _REMOTE_SCRIPT_NOT_A_REPO:
+        result['initialized'] = False
+        result['message'] = f"{project_dir} is not a git repository"
+    elif process.returncode == _REMOTE_SCRIPT_EXISTS:
+        if url == remote_url:
+            result['success'] = True
+            result['message'] = f"Remote 'origin' already set to {remote_url}"
+        else:
+            result['message'] = f"Remote 'origin' already exists with different URL: {url}"
+    elif process.returncode == _REMOTE_SCRIPT_ADD_FAILED:
+        result['message'] = f"Failed to add remote: {process.stderr.strip()}"
+    elif process.returncode == _REMOTE_SCRIPT_VERIFY_FAILED:
+        result['message'] = "Remote added but verification failed"
+    elif process.returncode == _SHELL_COMMAND_NOT_FOUND:
+        result['message'] = "git command not found - please install git"
+    else:
+        result['message'] = f"Unexpected error: {process.stderr.strip()}"
+
+    return result
+
+
+async def setup_remote_many(pairs: list[tuple[Path, str]], max_concurrent: int = 32) -> list[dict]:
+    """
+    Set up the origin remote for several projects concurrently.
+
+    Each project directory is handled by setup_remote_and_probe() in a worker
+    thread, so every repository costs one shell process. Pairs that share a
+    directory run one after another to avoid racing on its git config; at
+    most max_concurrent directories are processed at once.
+
+    Args:
+        pairs: (project_dir, remote_url) tuples
+        max_concurrent: Maximum number of directories processed at once
+
+    Returns:
+        List of result dicts (see setup_remote_and_probe), in the order of pairs
+
+    Example:
+        results = await setup_remote_many([
+            (Path("./a"), "https://github.com/user/a.git"),
+            (Path("./b"), "https://github.com/user/b.git"),
+        ])
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results: list[Optional[dict]] = [None] * len(pairs)
+
+    # Group pair indexes by directory, preserving input order within a group
+    groups: dict[str, list[int]] = {}
+    for index, (project_dir, _) in enumerate(pairs):
+        groups.setdefault(os.path.realpath(project_dir), []).append(index)
+
+    def run_group(indexes: list[int]) -> None:
+        for index in indexes:
+            results[index] = setup_remote_and_probe(*pairs[index])
+
+    async def setup(indexes: list[int]) -> None:
+        async with semaphore:
+            await asyncio.to_thread(run_group, indexes)
+
+    await asyncio.gather(*(setup(indexes) for indexes in groups.values()))
+    return results
+
+
+def setup_remote_many_sync(pairs: list[tuple[Path, str]], max_concurrent: int = 32) -> list[dict]:
+    """
+    Synchronous wrapper around setup_remote_many().
+
+    Must not be called from a running event loop; use
+    `await setup_remote_many(...)` there instead.
+
+    Args:
+        pairs: (project_dir, remote_url) tuples
+        max_concurrent: Maximum number of directories processed at once
+
+    Returns:
+        List of result dicts, in the order of pairs
+    """
+    return asyncio.run(setup_remote_many(pairs, max_concurrent))
+
+
+# ---------------------------------------------------------------------------
+# pygit2 backend (used when USE_PYGIT2 is enabled)
+# ---------------------------------------------------------------------------
+
+def _pygit2_init(project_dir: Path) -> tuple[bool, str]:
+    """In-process equivalent of the `git init` path in ensure_git_initialized."""
+    try:
+        pygit2.init_repository(str(project_dir))
+    except pygit2.GitError as e:
+        return False, f"git init failed: {e}"
+
+    if os.path.isdir(project_dir / ".git"):
+        return True, "Repository initialized successfully"
+    return False, "git init succeeded but .git directory not found"
+
+
+def _commit_subject(message: str) -> str:
+    """Return a commit message's subject line, matching git's %s format."""
+    paragraph = message.strip().split("\n\n", 1)[0]
+    return " ".join(line.strip() for line in paragraph.splitlines())
+
+
+def _pygit2_status(project_dir: Path, status: dict) -> dict:
+    """In-process equivalent of the subprocess queries in get_git_status."""
+    try:
+        repo = pygit2.Repository(str(project_dir))
+
+        if repo.head_is_unborn:
+            # No commits yet: anything staged or present in the working tree
+            # (untracked included) is uncommitted
+            status['branch'] = repo.references["HEAD"].target.removeprefix("refs/heads/")
+            status['uncommitted_changes'] = len(repo.index) > 0 or bool(
+                repo.status(untracked_files="normal")
+            )
+            return status
+
+        status['branch'] = "HEAD" if repo.head_is_detached else repo.head.shorthand
+
+        # Only tracked changes count; skip walking untracked files entirely
+        status['uncommitted_changes'] = bool(repo.status(untracked_files="no"))
+
+        commit = repo[repo.head.target]
+        status['last_commit_hash'] = str(commit.id)
+        status['last_commit_message'] = _commit_subject(commit.message)
+    except (pygit2.GitError, KeyError, ValueError):
+        # Return partial status on error
+        pass
+
+    return status
+
+
+def _pygit2_commit(project_dir: Path, commit_msg: str) -> tuple[bool, str, str]:
+    """In-process equivalent of the add/diff/commit/rev-parse steps in create_commit."""
+    try:
+        repo = pygit2.Repository(str(project_dir))
+        index = repo.index
+
+        # Stage all changes, including deletions (like `git add .`)
+        index.add_all()
+        for entry in list(index):
+            if not os.path.lexists(project_dir / entry.path):
+                index.remove(entry.path)
+        index.write()
+        tree_id = index.write_tree()
+
+        # Check if there's anything to commit
+        if repo.head_is_unborn:
+            if len(index) == 0:
+                return True, "", "No changes to commit"
+            parents = []
+        else:
+            head_commit = repo[repo.head.target]
+            if head_commit.tree_id == tree_id:
+                return True, "", "No changes to commit"
+            parents = [head_commit.id]
+
+        signature = repo.default_signature
+        # git commit -m normalizes the message to end with a single newline
+        commit_id = repo.create_commit(
+            "HEAD", signature, signature, commit_msg.rstrip() + "\n", tree_id, parents
+        )
+        return True, str(commit_id), ""
+
+    except KeyError:
+        return False, "", "git commit failed: user.name/user.email not configured"
+    except pygit2.GitError as e:
+        return False, "", f"git commit failed: {e}"
+
+
+def _pygit2_setup_remote(project_dir: Path, remote_url: str) -> tuple[bool, str]:
+    """In-process equivalent of the remote add/verify steps in setup_remote."""
+    try:
+        repo = pygit2.Repository(str(project_dir))
+
+        # Check if remote already exists
+        try:
+            existing_url = repo.remotes["origin"].url
+        except KeyError:
+            existing_url = None
+
+        if existing_url is not None:
+            if existing_url == remote_url:
+                return True, f"Remote 'origin' already set to {remote_url}"
+            return False, f"Remote 'origin' already exists with different URL: {existing_url}"
+
+        # Add the remote and verify it was added
+        repo.remotes.create("origin", remote_url)
+        verified_url = repo.remotes["origin"].url
+        if verified_url == remote_url:
+            return True, f"Remote 'origin' configured successfully: {remote_url}"
+        return False, f"Remote added but URL mismatch: {verified_url}"
+
+    except (pygit2.GitError, ValueError) as e:
+        return False, f"Failed to add remote: {e}"
@@ -14,11 +14,34 @@ Features:
 
 import asyncio
 import builtins
-from contextlib import contextmanager
-from datetime import datetime
+import sys
+import time
 from typing import Optional
 
 
+class _ActivityContext:
+    """
+    Sets the logger's current activity for the duration of a with block.
+
+    A small slotted class instead of a @contextmanager generator, so
+    entering an activity doesn't allocate a generator frame and wrapper.
+    """
+
+    __slots__ = ("_logger", "_name", "_previous")
+
+    def __init__(self, logger: "TimestampedLogger", activity_name: str):
+        self._logger = logger
+        self._name = activity_name
+        self._previous: Optional[str] = None
+
+    def __enter__(self) -> None:
+        self._previous = self._logger.current_activity
+        self._logger.current_activity = self._name
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._logger.current_activity = self._previous
+
+
 class TimestampedLogger:
     """
     Centralized logger with timestamps and activity indicators.
@@ -30,14 +53,15 @@ class TimestampedLogger:
 
     def __init__(self):
         """Initialize the logger."""
-        self.session_start_time = datetime.now()
-        self.last_output_time = datetime.now()
+        self._session_start_monotonic = time.monotonic()
+        self._last_output_ts = time.monotonic()
+        self._last_timestamp_key: Optional[tuple[int, int]] = None
+        self._last_timestamp = ""
         self.current_activity: Optional[str] = None
-        self.current_tool_start_time: Optional[datetime] = None
+        self._current_tool_start_ns: Optional[int] = None
         self.heartbeat_task: Optional[asyncio.Task] = None
         self.heartbeat_interval = 30  # seconds
         self._original_print = builtins.print
-        self._lock = asyncio.Lock() if hasattr(asyncio, 'Lock') else None
 
     def format_timestamp(self) -> str:
         """
@@ -46,20 +70,26 @@ class TimestampedLogger:
         Returns:
             Formatted timestamp string: "14:23:45 [+00:05:23]"
         """
-        now = datetime.now()
+        now = time.time()
+        wall_seconds = int(now)
+        elapsed_seconds = int(time.monotonic() - self._session_start_monotonic)
+
+        # Both parts have one-second resolution - reuse the last string
+        key = (wall_seconds, elapsed_seconds)
+        if key == self._last_timestamp_key:
+            return self._last_timestamp
 
         # Actual time in HH:MM:SS format
-        actual_time = now.strftime("%H:%M:%S")
+        actual_time = time.strftime("%H:%M:%S", time.localtime(now))
 
         # Elapsed time since session start
-        elapsed = now - self.session_start_time
-        elapsed_seconds = int(elapsed.total_seconds())
-        hours = elapsed_seconds // 3600
-        minutes = (elapsed_seconds % 3600) // 60
-        seconds = elapsed_seconds % 60
+        hours, remainder = divmod(elapsed_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
         elapsed_time = f"[+{hours:02d}:{minutes:02d}:{seconds:02d}]"
 
-        return f"{actual_time} {elapsed_time}"
+        self._last_timestamp_key = key
+        self._last_timestamp = f"{actual_time} {elapsed_time}"
+        return self._last_timestamp
 
     def timestamped_print(self, *args, **kwargs):
         """
@@ -69,7 +99,7 @@ class TimestampedLogger:
         Preserves all print() kwargs (end, flush, file, etc.).
         """
         # Update last output time
-        self.last_output_time = datetime.now()
+        self._last_output_ts = time.monotonic()
 
         # Get the separator (default is space)
         sep = kwargs.get('sep', ' ')
@@ -82,25 +112,65 @@ class TimestampedLogger:
         else:
             message = sep.join(str(arg) for arg in args)
 
-        # Split multiline messages and add timestamp to each line
-        if message:
-            lines = message.split("\n")
-            timestamped_lines = []
-            for line in lines:
-                if line.strip():  # Non-empty lines get timestamps
-                    timestamped_lines.append(f"{self.format_timestamp()} {line}")
-                else:  # Empty lines stay empty (preserve formatting)
-                    timestamped_lines.append("")
-
-            # Join and print
-            final_message = "\n".join(timestamped_lines)
-        else:
-            # Empty print() call - just print empty line with timestamp
-            final_message = self.format_timestamp()
+        final_message = self._timestamp_lines(message)
 
         # Use original print with all kwargs preserved
         self._original_print(final_message, **kwargs)
 
+    def _timestamp_lines(self, message: str) -> str:
+        """
+        Prefix each non-empty line of message with the current timestamp.
+
+        Args:
+            message: Fully formatted message (may be empty or multiline)
+
+        Returns:
+            Message with timestamps; an empty message becomes just the timestamp
+        """
+        timestamp = self.format_timestamp()
+        if not message:
+            # Empty print() call - just print empty line with timestamp
+            return timestamp
+        if "\n" not in message:
+            # Common single-line case - no split/join needed
+            return f"{timestamp} {message}" if not message.isspace() else ""
+        # Empty lines stay empty (preserve formatting)
+        return "\n".join([
+            f"{timestamp} {line}" if line and not line.isspace() else ""
+            for line in message.split("\n")
+        ])
+
+    def _make_fast_print(self):
+        """
+        Build the function installed as builtins.print.
+
+        Plain print(x) calls (one argument, no keyword arguments) are
+        written straight to sys.stdout; anything else goes through
+        timestamped_print() and the original print().
+
+        Returns:
+            print()-compatible function
+        """
+        timestamped_print = self.timestamped_print
+        timestamp_lines = self._timestamp_lines
+
+        def fast_print(*args, **kwargs):
+            if kwargs or len(args) != 1:
+                return timestamped_print(*args, **kwargs)
+
+            out = sys.stdout
+            if out is None:
+                return None
+
+            self._last_output_ts = time.monotonic()
+            message = args[0]
+            if type(message) is not str:
+                message = str(message)
+            out.write(timestamp_lines(message) + "\n")
+            return None
+
+        return fast_print
+
     def set_activity(self, activity: Optional[str]):
         """
         Set current activity for heartbeat messages.
@@ -119,7 +189,7 @@ class TimestampedLogger:
         Args:
             tool_name: Name of the tool being executed
         """
-        self.current_tool_start_time = datetime.now()
+        self._current_tool_start_ns = time.monotonic_ns()
         self.current_activity = f"Waiting for {tool_name}"
 
     def end_tool(self):
@@ -128,10 +198,9 @@ class TimestampedLogger:
 
         Clears tool duration tracking.
         """
-        self.current_tool_start_time = None
+        self._current_tool_start_ns = None
 
-    @contextmanager
-    def activity(self, activity_name: str):
+    def activity(self, activity_name: str) -> "_ActivityContext":
         """
         Context manager for tracking activities.
 
@@ -143,12 +212,7 @@ class TimestampedLogger:
         Args:
             activity_name: Description of the activity
         """
-        old_activity = self.current_activity
-        self.current_activity = activity_name
-        try:
-            yield
-        finally:
-            self.current_activity = old_activity
+        return _ActivityContext(self, activity_name)
 
     async def heartbeat_loop(self):
         """
@@ -163,7 +227,7 @@ class TimestampedLogger:
                 await asyncio.sleep(self.heartbeat_interval)
 
                 # Check if we've been silent for 30+ seconds
-                silence_duration = (datetime.now() - self.last_output_time).total_seconds()
+                silence_duration = time.monotonic() - self._last_output_ts
 
                 if silence_duration >= self.heartbeat_interval:
                     # Build heartbeat message with tool duration if applicable
@@ -172,8 +236,8 @@ class TimestampedLogger:
                         activity_msg = f" ({self.current_activity}"
 
                         # Add tool duration if we're waiting for a tool
-                        if self.current_tool_start_time:
-                            tool_duration = (datetime.now() - self.current_tool_start_time).total_seconds()
+                        if self._current_tool_start_ns is not None:
+                            tool_duration = (time.monotonic_ns() - self._current_tool_start_ns) / 1e9
                             activity_msg += f" - {tool_duration:.0f}s"
 
                         activity_msg += ")"
@@ -218,7 +282,7 @@ class TimestampedLogger:
         After calling this, all print() calls in all modules
         will automatically get timestamps.
         """
-        builtins.print = self.timestamped_print
+        builtins.print = self._make_fast_print()
 
     def uninstall(self):
         """
@@ -234,8 +298,8 @@ class TimestampedLogger:
 
         Elapsed time will be calculated from this new start time.
         """
-        self.session_start_time = datetime.now()
-        self.last_output_time = datetime.now()
+        self._session_start_monotonic = time.monotonic()
+        self._last_output_ts = time.monotonic()
 
 
 # Global singleton instance
@@ -8,6 +8,36 @@ Utilities for diagnosing MCP server health and connectivity.
 from typing import List
 
 
+# Static suggestion blocks (lines mentioning the tool/duration are built per call)
+_LINEAR_HEADER = ("Linear MCP Server Issues:", "- Check Linear API status: https://status.linear.app")
+_LINEAR_SUGGESTIONS = (
+    "- Large queries (limit > 100) can timeout",
+    "- Try reducing query limit or filtering results",
+    "- Check LINEAR_API_KEY is still valid",
+)
+_PUPPETEER_SUGGESTIONS = (
+    "Puppeteer MCP Server Issues:",
+    "- Check if browser process is hung",
+    "- Page might be slow to load or unresponsive",
+    "- Network requests on page might be timing out",
+)
+_GENERIC_SUGGESTIONS = (
+    "Possible causes:",
+    "- Network connectivity issues",
+    "- MCP server crash or hang",
+    "- API rate limiting or timeout",
+    "- Large response payload",
+)
+_RECOVERY_SUFFIX = (
+    "",
+    "Recovery options:",
+    "- Wait longer (some operations are legitimately slow)",
+    "- Interrupt (Ctrl+C) and restart with different parameters",
+    "- Check MCP server logs for errors",
+    "- File a bug report if this persists",
+)
+
+
 def diagnose_stuck_tool(tool_name: str, duration: float) -> List[str]:
     """
     Provide diagnostic suggestions for stuck tools.
@@ -19,43 +49,21 @@ def diagnose_stuck_tool(tool_name: str, duration: float) -> List[str]:
     Returns:
         List of diagnostic suggestions
     """
-    suggestions = []
-
-    if "linear" in tool_name.lower():
-        suggestions.extend([
-            "Linear MCP Server Issues:",
-            "- Check Linear API status: https://status.linear.app",
-            f"- Tool '{tool_name}' has been running for {duration:.0f}s",
-            "- Large queries (limit > 100) can timeout",
-            "- Try reducing query limit or filtering results",
-            "- Check LINEAR_API_KEY is still valid",
-        ])
-
-    if "puppeteer" in tool_name.lower():
-        suggestions.extend([
-            "Puppeteer MCP Server Issues:",
-            "- Check if browser process is hung",
-            "- Page might be slow to load or unresponsive",
-            "- Network requests on page might be timing out",
-        ])
+    suggestions: List[str] = []
+    tool_lower = tool_name.lower()
+
+    if "linear" in tool_lower:
+        suggestions += _LINEAR_HEADER
+        suggestions.append(f"- Tool '{tool_name}' has been running for {duration:.0f}s")
+        suggestions += _LINEAR_SUGGESTIONS
+
+    if "puppeteer" in tool_lower:
+        suggestions += _PUPPETEER_SUGGESTIONS
 
     if not suggestions:
-        suggestions.extend([
-            f"Tool '{tool_name}' has been running for {duration:.0f}s",
-            "Possible causes:",
-            "- Network connectivity issues",
-            "- MCP server crash or hang",
-            "- API rate limiting or timeout",
-            "- Large response payload",
-        ])
-
-    suggestions.extend([
-        "",
-        "Recovery options:",
-        "- Wait longer (some operations are legitimately slow)",
-        "- Interrupt (Ctrl+C) and restart with different parameters",
-        "- Check MCP server logs for errors",
-        "- File a bug report if this persists",
-    ])
+        suggestions.append(f"Tool '{tool_name}' has been running for {duration:.0f}s")
+        suggestions += _GENERIC_SUGGESTIONS
+
+    suggestions += _RECOVERY_SUFFIX
 
     return suggestions
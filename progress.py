@@ -7,32 +7,57 @@ Progress is tracked via Linear issues, with local state cached in .linear_projec
 """
 
 import json
+import os
 from pathlib import Path
 
+from git_operations import get_git_status
 from linear_config import LINEAR_PROJECT_MARKER
 
+try:
+    # Optional faster JSON parser; its decode error subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Parsed marker files keyed by path, with the mtime they were read at
+_linear_state_cache: dict[str, tuple[int, dict]] = {}
+
 
 def load_linear_project_state(project_dir: Path) -> dict | None:
     """
     Load the Linear project state from the marker file.
 
+    The parsed state is cached and only re-read when the file's
+    modification time changes.
+
     Args:
         project_dir: Directory containing .linear_project.json
 
     Returns:
         Project state dict or None if not initialized
     """
-    marker_file = project_dir / LINEAR_PROJECT_MARKER
+    marker_file = str(project_dir / LINEAR_PROJECT_MARKER)
 
-    if not marker_file.exists():
+    try:
+        mtime_ns = os.stat(marker_file).st_mtime_ns
+    except OSError:
+        _linear_state_cache.pop(marker_file, None)
         return None
 
+    cached = _linear_state_cache.get(marker_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
     try:
-        with open(marker_file, "r") as f:
-            return json.load(f)
+        with open(marker_file, "rb") as f:
+            state = _json_loads(f.read())
     except (json.JSONDecodeError, IOError):
         return None
 
+    _linear_state_cache[marker_file] = (mtime_ns, state)
+    return state
+
 
 def is_linear_initialized(project_dir: Path) -> bool:
     """
@@ -42,10 +67,13 @@ def is_linear_initialized(project_dir: Path) -> bool:
         project_dir: Directory to check
 
     Returns:
-        True if .linear_project.json exists and is valid
+        True if .linear_project.json exists, is valid and marked initialized
+
+    Uses the cached loader, so checking this and then loading the state
+    (e.g. via print_progress_summary) parses the file only once.
     """
     state = load_linear_project_state(project_dir)
-    return state is not None and state.get("initialized", False)
+    return bool(state and state.get("initialized"))
 
 
 def print_session_header(session_num: int, is_initializer: bool) -> None:
@@ -58,13 +86,18 @@ def print_session_header(session_num: int, is_initializer: bool) -> None:
     print()
 
 
-def print_progress_summary(project_dir: Path) -> None:
+def print_progress_summary(project_dir: Path, include_git: bool = True) -> None:
     """
     Print a summary of current progress.
 
     Since actual progress is tracked in Linear, this reads the local
     state file for cached information. The agent updates Linear directly
     and reports progress in session comments.
+
+    Args:
+        project_dir: Project directory
+        include_git: Also show the last commit (runs git); pass False when
+            the caller has just reported git status itself
     """
     state = load_linear_project_state(project_dir)
 
@@ -80,8 +113,10 @@ def print_progress_summary(project_dir: Path) -> None:
     print(f"  META issue ID: {meta_issue}")
     print(f"  (Check Linear for current Done/In Progress/Todo counts)")
 
+    if not include_git:
+        return
+
     # Add git status
-    from git_operations import get_git_status
     git_status = get_git_status(project_dir)
     if git_status['initialized'] and git_status['last_commit_hash']:
         print(f"\nGit Status:")
@@ -98,34 +133,38 @@ def print_git_guidance(project_dir: Path) -> None:
     Args:
         project_dir: Path to project directory
     """
-    from git_operations import get_git_status
-
-    print("\n" + "=" * 70)
-    print("  GIT REPOSITORY LOCATION")
-    print("=" * 70)
-    print(f"\nYour git repository is at:")
-    print(f"  📁 {project_dir.resolve()}")
-    print(f"\n⚠ This is NOT the harness directory you may have open in your editor.")
-    print(f"\nTo view git history in Cursor/VS Code:")
-    print(f"  File → Open Folder → {project_dir.resolve()}")
-    print(f"\nTo view git history in terminal:")
-    print(f"  cd {project_dir.resolve()}")
-    print(f"  git log --oneline -20")
-    print(f"  git status")
+    resolved_dir = project_dir.resolve()
+    lines = [
+        "\n" + "=" * 70,
+        "  GIT REPOSITORY LOCATION",
+        "=" * 70,
+        "\nYour git repository is at:",
+        f"  📁 {resolved_dir}",
+        "\n⚠ This is NOT the harness directory you may have open in your editor.",
+        "\nTo view git history in Cursor/VS Code:",
+        f"  File → Open Folder → {resolved_dir}",
+        "\nTo view git history in terminal:",
+        f"  cd {resolved_dir}",
+        "  git log --oneline -20",
+        "  git status",
+    ]
 
     status = get_git_status(project_dir)
     if status['initialized']:
-        print(f"\n📊 Git Status:")
-        print(f"  ✓ Repository initialized")
-        print(f"  Branch: {status['branch']}")
+        lines.append("\n📊 Git Status:")
+        lines.append("  ✓ Repository initialized")
+        lines.append(f"  Branch: {status['branch']}")
         if status['last_commit_hash']:
-            print(f"  Last commit: {status['last_commit_hash'][:8]} - {status['last_commit_message'][:50]}...")
+            lines.append(f"  Last commit: {status['last_commit_hash'][:8]} - {status['last_commit_message'][:50]}...")
         if status['uncommitted_changes']:
-            print(f"  ⚠ Uncommitted changes present")
+            lines.append("  ⚠ Uncommitted changes present")
         else:
-            print(f"  ✓ Working tree clean")
+            lines.append("  ✓ Working tree clean")
     else:
-        print(f"\n⚠ Git not initialized yet")
-        print(f"  The agent will initialize it in the first session")
+        lines.append("\n⚠ Git not initialized yet")
+        lines.append("  The agent will initialize it in the first session")
+
+    lines.append("=" * 70 + "\n")
 
-    print("=" * 70 + "\n")
+    # One print call for the whole block
+    print("\n".join(lines))
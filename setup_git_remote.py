@@ -9,17 +9,18 @@ Usage:
     python setup_git_remote.py --project-dir ./generations/my_project \\
         --remote-url https://github.com/user/repo.git
 
+    python setup_git_remote.py --batch-file pairs.txt
+
 Then push:
     cd generations/my_project
     git push -u origin main
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
-from git_operations import setup_remote, get_git_status
-
 
 def main() -> int:
     """Main entry point for the script."""
@@ -37,6 +38,9 @@ Examples:
   cd generations/my_project
   git push -u origin main
 
+  # Set up remotes for many projects (one "<project_dir>\\t<remote_url>" per line)
+  python setup_git_remote.py --batch-file pairs.txt
+
 Notes:
   - Create the GitHub repository manually first
   - The project directory must already have git initialized
@@ -47,70 +51,176 @@ Notes:
     parser.add_argument(
         "--project-dir",
         type=Path,
-        required=True,
         help="Path to generated project (e.g., ./generations/my_project)",
     )
 
     parser.add_argument(
         "--remote-url",
         type=str,
-        required=True,
         help="GitHub remote URL (e.g., https://github.com/user/repo.git or git@github.com:user/repo.git)",
     )
 
+    parser.add_argument(
+        "--batch-file",
+        type=Path,
+        help="File of tab-separated '<project_dir>\\t<remote_url>' lines to set up in one run",
+    )
+
     args = parser.parse_args()
 
-    # Verify project directory exists
-    if not args.project_dir.exists():
-        print(f"❌ Error: Project directory does not exist: {args.project_dir}")
-        print(f"   Make sure you're using the correct path")
+    if args.batch_file is not None:
+        if args.project_dir is not None or args.remote_url is not None:
+            parser.error("--batch-file cannot be combined with --project-dir/--remote-url")
+        return run_batch(parser, args.batch_file)
+
+    if args.project_dir is None or args.remote_url is None:
+        parser.error("--project-dir and --remote-url are required (or use --batch-file)")
+
+    # Verify project directory exists (resolve the path once and reuse it)
+    resolved_dir = os.path.realpath(args.project_dir)
+    exists, has_git = inspect_project_dir(resolved_dir)
+    if not exists:
+        print(
+            f"❌ Error: Project directory does not exist: {args.project_dir}\n"
+            f"   Make sure you're using the correct path"
+        )
         return 1
 
-    # Verify project has git initialized
-    status = get_git_status(args.project_dir)
-    if not status["initialized"]:
-        print(f"❌ Error: {args.project_dir} is not a git repository")
-        print(f"   Make sure the agent has initialized git first")
-        print(f"   Or run: cd {args.project_dir} && git init")
+    # Verify git is initialized and set up the remote in one step. A missing
+    # .git entry is rejected up front without spawning git at all.
+    if has_git:
+        # Imported here so --help and argument errors skip loading git_operations
+        from git_operations import setup_remote_and_probe
+
+        result = setup_remote_and_probe(args.project_dir, args.remote_url)
+    else:
+        result = {"initialized": False}
+    if not result["initialized"]:
+        print(
+            f"❌ Error: {args.project_dir} is not a git repository\n"
+            f"   Make sure the agent has initialized git first\n"
+            f"   Or run: cd {args.project_dir} && git init"
+        )
         return 1
 
-    print(f"Setting up remote for: {args.project_dir.resolve()}")
-    print(f"Remote URL: {args.remote_url}")
-    print()
+    success, msg = result["success"], result["message"]
 
-    # Set up the remote
-    success, msg = setup_remote(args.project_dir, args.remote_url)
+    # Build the whole report and print it once
+    lines = [
+        f"Setting up remote for: {resolved_dir}",
+        f"Remote URL: {args.remote_url}",
+        "",
+    ]
 
     if success:
-        print(f"✅ {msg}")
-        print()
-        print(f"📤 To push to GitHub:")
-        print(f"   cd {args.project_dir.resolve()}")
-
         # Suggest appropriate branch name
-        branch = status.get("branch", "main")
-        if branch:
-            print(f"   git push -u origin {branch}")
-        else:
-            print(f"   git push -u origin main  # or master, depending on your default branch")
-
-        print()
-        print(f"💡 Tips:")
-        print(f"   - The agent's commits will accumulate locally")
-        print(f"   - Push manually whenever you want to sync with GitHub")
-        print(f"   - You can configure automatic push by modifying the agent code")
-        return 0
+        branch = result.get("branch") or "main"
+        lines += [
+            f"✅ {msg}",
+            "",
+            "📤 To push to GitHub:",
+            f"   cd {resolved_dir}",
+            f"   git push -u origin {branch}",
+            "",
+            "💡 Tips:",
+            "   - The agent's commits will accumulate locally",
+            "   - Push manually whenever you want to sync with GitHub",
+            "   - You can configure automatic push by modifying the agent code",
+        ]
     else:
-        print(f"❌ {msg}")
-        print()
-        print(f"💡 Troubleshooting:")
-        print(f"   - Check that the remote URL is correct")
-        print(f"   - Ensure you have access to the GitHub repository")
-        print(f"   - If remote already exists, you may need to remove it first:")
-        print(f"     cd {args.project_dir.resolve()}")
-        print(f"     git remote remove origin")
-        print(f"     # Then run this script again")
-        return 1
+        lines += [
+            f"❌ {msg}",
+            "",
+            "💡 Troubleshooting:",
+            "   - Check that the remote URL is correct",
+            "   - Ensure you have access to the GitHub repository",
+            "   - If remote already exists, you may need to remove it first:",
+            f"     cd {resolved_dir}",
+            "     git remote remove origin",
+            "     # Then run this script again",
+        ]
+
+    print("\n".join(lines))
+    return 0 if success else 1
+
+
+def inspect_project_dir(resolved_dir: str) -> tuple[bool, bool]:
+    """
+    Check a project directory without spawning git.
+
+    Args:
+        resolved_dir: Resolved path to the project directory
+
+    Returns:
+        (exists, has_git) - has_git is True for a .git directory or a
+        gitdir pointer file (worktrees)
+    """
+    try:
+        os.stat(resolved_dir)
+    except OSError:
+        return False, False
+    return True, os.path.exists(os.path.join(resolved_dir, ".git"))
+
+
+def run_batch(parser: argparse.ArgumentParser, batch_file: Path) -> int:
+    """
+    Set up remotes for every project listed in a batch file.
+
+    Each non-empty line is "<project_dir>\\t<remote_url>"; lines starting
+    with "#" are ignored.
+
+    Args:
+        parser: Argument parser, used to report malformed input
+        batch_file: Path to the batch file
+
+    Returns:
+        0 if every remote was set up, 1 otherwise
+    """
+    try:
+        lines = batch_file.read_text().splitlines()
+    except OSError as e:
+        parser.error(f"cannot read batch file: {e}")
+
+    pairs = []
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        project_dir, sep, remote_url = line.partition("\t")
+        if not sep or not project_dir.strip() or not remote_url.strip():
+            parser.error(f"{batch_file}:{line_number}: expected '<project_dir>\\t<remote_url>'")
+        pairs.append((Path(project_dir.strip()), remote_url.strip()))
+
+    # Apply the same checks as single mode; only real repositories reach git
+    results = [None] * len(pairs)
+    to_setup = []
+    for index, (project_dir, _) in enumerate(pairs):
+        exists, has_git = inspect_project_dir(os.path.realpath(project_dir))
+        if not exists:
+            results[index] = {"success": False, "message": "Project directory does not exist"}
+        elif not has_git:
+            results[index] = {"success": False, "message": f"{project_dir} is not a git repository"}
+        else:
+            to_setup.append(index)
+
+    if to_setup:
+        from git_operations import setup_remote_many_sync
+
+        setup_results = setup_remote_many_sync([pairs[index] for index in to_setup])
+        for index, result in zip(to_setup, setup_results):
+            results[index] = result
+
+    lines = []
+    failures = 0
+    for (project_dir, _), result in zip(pairs, results):
+        if result["success"]:
+            lines.append(f"✅ {project_dir}: {result['message']}")
+        else:
+            failures += 1
+            lines.append(f"❌ {project_dir}: {result['message']}")
+
+    lines += ["", f"{len(pairs) - failures}/{len(pairs)} remotes configured"]
+    print("\n".join(lines))
+    return 1 if failures else 0
 
 
 if __name__ == "__main__":
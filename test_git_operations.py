@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""
+Git Operations Tests
+====================
+
+Tests for the batched shell scripts behind create_commit and
+setup_remote_and_probe, and for the optional pygit2 backend. Each
+exit-code path is run against a temporary repository.
+Run with: python test_git_operations.py
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import git_operations
+from git_operations import (
+    create_commit,
+    ensure_git_initialized,
+    get_git_status,
+    get_git_status_many_sync,
+    setup_remote,
+    setup_remote_and_probe,
+    setup_remote_many_sync,
+)
+from setup_git_remote import run_batch
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+REMOTE_URL = "https://github.com/user/repo.git"
+
+
+def git(project_dir: Path, *args: str) -> None:
+    """Run a git command in project_dir, failing loudly on error."""
+    subprocess.run(["git", "-C", str(project_dir), *args], check=True, capture_output=True)
+
+
+def make_repo(project_dir: Path, with_commit: bool = False) -> Path:
+    """Initialize a repository on branch main with a local identity."""
+    project_dir.mkdir(parents=True, exist_ok=True)
+    git(project_dir, "init", "-q")
+    git(project_dir, "symbolic-ref", "HEAD", "refs/heads/main")
+    git(project_dir, "config", "user.name", "Test")
+    git(project_dir, "config", "user.email", "test@example.com")
+    if with_commit:
+        git(project_dir, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+    return project_dir
+
+
+def without_git(func, *args):
+    """Call func with a PATH that has no git executable on it."""
+    saved = os.environ["PATH"]
+    os.environ["PATH"] = os.devnull
+    try:
+        return func(*args)
+    finally:
+        os.environ["PATH"] = saved
+
+
+def check(description: str, ok: bool, detail: object) -> bool:
+    """Print a PASS/FAIL line for one case."""
+    if ok:
+        print(f"  PASS: {description}")
+        return True
+    print(f"  FAIL: {description}")
+    print(f"         Got: {detail!r}")
+    return False
+
+
+def test_get_git_status(tmp: Path):
+    """Test uncommitted-change detection, including repos with no commits."""
+    print("\nTesting get_git_status:\n")
+    results = []
+
+    unborn = make_repo(tmp / "status_unborn")
+    status = get_git_status(unborn)
+    results.append(check(
+        "empty repository without commits is clean",
+        status["initialized"] and not status["uncommitted_changes"]
+        and status["branch"] == "main",
+        status,
+    ))
+
+    (unborn / "app.py").write_text("print('hello')\n")
+    status = get_git_status(unborn)
+    results.append(check(
+        "untracked file without any commit is uncommitted",
+        status["uncommitted_changes"] and status["last_commit_hash"] == "",
+        status,
+    ))
+
+    committed = make_repo(tmp / "status_committed", with_commit=True)
+    (committed / "notes.txt").write_text("scratch\n")
+    status = get_git_status(committed)
+    results.append(check(
+        "untracked file after a commit is ignored",
+        not status["uncommitted_changes"] and len(status["last_commit_hash"]) == 40,
+        status,
+    ))
+
+    return results.count(True), results.count(False)
+
+
+def test_get_git_status_many(tmp: Path):
+    """Test that concurrent status checks keep input order."""
+    print("\nTesting get_git_status_many:\n")
+    results = []
+
+    first = make_repo(tmp / "many_first", with_commit=True)
+    git(first, "checkout", "-q", "-b", "first")
+    second = make_repo(tmp / "many_second", with_commit=True)
+    git(second, "checkout", "-q", "-b", "second")
+    missing = tmp / "many_missing"
+
+    project_dirs = [second, missing, first, second]
+    statuses = get_git_status_many_sync(project_dirs, max_concurrent=2)
+    results.append(check(
+        "results follow input order",
+        [status["branch"] for status in statuses] == ["second", "", "first", "second"],
+        statuses,
+    ))
+    results.append(check(
+        "missing directory is not initialized",
+        not statuses[1]["initialized"] and all(
+            status["initialized"] for index, status in enumerate(statuses) if index != 1
+        ),
+        statuses,
+    ))
+
+    return results.count(True), results.count(False)
+
+
+def test_setup_remote_and_probe(tmp: Path):
+    """Test each outcome of the remote setup script."""
+    print("\nTesting setup_remote_and_probe:\n")
+    results = []
+
+    repo = make_repo(tmp / "remote_new")
+    result = setup_remote_and_probe(repo, REMOTE_URL)
+    results.append(check(
+        "adds origin to a fresh repository",
+        result["initialized"] and result["success"] and result["branch"] == "main"
+        and "configured successfully" in result["message"],
+        result,
+    ))
+
+    result = setup_remote_and_probe(repo, REMOTE_URL)
+    results.append(check(
+        "origin already set to the same URL",
+        result["success"] and "already set" in result["message"],
+        result,
+    ))
+
+    result = setup_remote_and_probe(repo, "https://github.com/user/other.git")
+    results.append(check(
+        "origin already set to a different URL",
+        not result["success"] and REMOTE_URL in result["message"]
+        and "different URL" in result["message"],
+        result,
+    ))
+
+    plain_dir = tmp / "not_a_repo"
+    plain_dir.mkdir()
+    result = setup_remote_and_probe(plain_dir, REMOTE_URL)
+    results.append(check(
+        "directory without .git is not a repository",
+        not result["initialized"] and not result["success"],
+        result,
+    ))
+
+    main_repo = make_repo(tmp / "worktree_main", with_commit=True)
+    worktree = tmp / "worktree"
+    git(main_repo, "worktree", "add", "-q", "-b", "feature", str(worktree))
+    result = setup_remote_and_probe(worktree, REMOTE_URL)
+    results.append(check(
+        "worktree (.git file) is accepted",
+        result["initialized"] and result["success"] and result["branch"] == "feature",
+        result,
+    ))
+
+    broken = make_repo(tmp / "remote_broken")
+    with open(broken / ".git" / "config", "a") as f:
+        f.write("[broken\n")
+    result = setup_remote_and_probe(broken, REMOTE_URL)
+    results.append(check(
+        "git remote add failure is reported",
+        result["initialized"] and not result["success"]
+        and result["message"].startswith("Failed to add remote:"),
+        result,
+    ))
+
+    result = without_git(setup_remote_and_probe, make_repo(tmp / "remote_nogit"), REMOTE_URL)
+    results.append(check(
+        "missing git binary is reported",
+        not result["success"] and result["message"] == "git command not found - please install git",
+        result,
+    ))
+
+    return results.count(True), results.count(False)
+
+
+def test_setup_remote_many(tmp: Path):
+    """Test batch remote setup and --batch-file parsing."""
+    print("\nTesting setup_remote_many and --batch-file:\n")
+    results = []
+    other_url = "https://github.com/user/other.git"
+
+    # Two spellings of one directory are grouped and run in order
+    repo = make_repo(tmp / "many_remote")
+    second = make_repo(tmp / "many_remote_second")
+    outcomes = setup_remote_many_sync([
+        (repo, REMOTE_URL),
+        (second, other_url),
+        (repo / ".", other_url),
+    ])
+    results.append(check(
+        "same directory runs sequentially, results in input order",
+        [outcome["success"] for outcome in outcomes] == [True, True, False]
+        and "different URL" in outcomes[2]["message"],
+        outcomes,
+    ))
+
+    batch_repo = make_repo(tmp / "batch_repo")
+    plain_dir = tmp / "batch_plain"
+    plain_dir.mkdir()
+    batch_file = tmp / "pairs.txt"
+    batch_file.write_text(
+        "# project\tremote\n"
+        "\n"
+        f"{batch_repo}\t{REMOTE_URL}\n"
+        f"{batch_repo}\t{other_url}\n"
+        f"{tmp / 'batch_missing'}\t{REMOTE_URL}\n"
+        f"{plain_dir}\t{REMOTE_URL}\n"
+    )
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        exit_code = run_batch(argparse.ArgumentParser(), batch_file)
+    lines = output.getvalue().splitlines()
+    results.append(check(
+        "batch file reports each entry",
+        exit_code == 1 and len(lines) == 6
+        and lines[0].startswith("✅") and "configured successfully" in lines[0]
+        and lines[1].startswith("❌") and "different URL" in lines[1]
+        and lines[2].endswith("Project directory does not exist")
+        and lines[3].endswith("is not a git repository")
+        and lines[5] == "1/4 remotes configured",
+        lines,
+    ))
+
+    batch_file.write_text(f"{batch_repo} {REMOTE_URL}\n")
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            run_batch(argparse.ArgumentParser(), batch_file)
+        exit_code = None
+    except SystemExit as e:
+        exit_code = e.code
+    results.append(check(
+        "malformed batch line is a usage error",
+        exit_code == 2,
+        exit_code,
+    ))
+
+    return results.count(True), results.count(False)
+
+
+def test_create_commit(tmp: Path):
+    """Test each outcome of the commit script."""
+    print("\nTesting create_commit:\n")
+    results = []
+
+    repo = make_repo(tmp / "commit")
+    (repo / "app.py").write_text("print('hello')\n")
+    result = create_commit(repo, "Add app")
+    success, commit_hash, _ = result
+    results.append(check(
+        "commits staged changes and returns the hash",
+        success and len(commit_hash) == 40,
+        result,
+    ))
+
+    result = create_commit(repo, "Nothing new")
+    results.append(check(
+        "nothing to commit",
+        result == (True, "", "No changes to commit"),
+        result,
+    ))
+
+    corrupt = make_repo(tmp / "commit_corrupt_index")
+    (corrupt / "app.py").write_text("print('hello')\n")
+    (corrupt / ".git" / "index").write_bytes(b"garbage")
+    result = create_commit(corrupt, "Add app")
+    results.append(check(
+        "git add failure is reported",
+        not result[0] and result[2].startswith("git add failed:"),
+        result,
+    ))
+
+    anonymous = make_repo(tmp / "commit_no_identity")
+    git(anonymous, "config", "--unset", "user.name")
+    git(anonymous, "config", "--unset", "user.email")
+    git(anonymous, "config", "user.useConfigOnly", "true")
+    (anonymous / "app.py").write_text("print('hello')\n")
+    result = create_commit(anonymous, "Add app")
+    results.append(check(
+        "git commit failure is reported",
+        not result[0] and result[2].startswith("git commit failed:"),
+        result,
+    ))
+
+    nogit = make_repo(tmp / "commit_nogit")
+    (nogit / "app.py").write_text("print('hello')\n")
+    result = without_git(create_commit, nogit, "Add app")
+    results.append(check(
+        "missing git binary is reported",
+        result == (False, "", "git command not found - please install git"),
+        result,
+    ))
+
+    return results.count(True), results.count(False)
+
+
+def tracked_files(project_dir: Path) -> list[str]:
+    """List the files in project_dir's index."""
+    result = subprocess.run(
+        ["git", "-C", str(project_dir), "ls-files"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.split()
+
+
+def test_pygit2_backend(tmp: Path):
+    """Test the in-process pygit2 status, commit and remote functions."""
+    print("\nTesting pygit2 backend:\n")
+    results = []
+
+    fresh = tmp / "pygit2_init"
+    fresh.mkdir()
+    result = ensure_git_initialized(fresh)
+    results.append(check(
+        "initializes a repository",
+        result == (True, "Repository initialized successfully"),
+        result,
+    ))
+
+    # Status
+    repo = make_repo(tmp / "pygit2_repo")
+    status = get_git_status(repo)
+    results.append(check(
+        "unborn HEAD without files is clean",
+        status["initialized"] and not status["uncommitted_changes"]
+        and status["branch"] == "main",
+        status,
+    ))
+
+    (repo / "app.py").write_text("print('hello')\n")
+    status = get_git_status(repo)
+    results.append(check(
+        "unborn HEAD with an untracked file is uncommitted",
+        status["uncommitted_changes"] and status["last_commit_hash"] == "",
+        status,
+    ))
+
+    # Commits
+    result = create_commit(repo, "Add app")
+    success, commit_hash, _ = result
+    results.append(check(
+        "first commit on an unborn HEAD",
+        success and len(commit_hash) == 40 and tracked_files(repo) == ["app.py"],
+        result,
+    ))
+
+    (repo / "notes.txt").write_text("scratch\n")
+    status = get_git_status(repo)
+    results.append(check(
+        "untracked file after a commit is ignored",
+        not status["uncommitted_changes"] and status["last_commit_hash"] == commit_hash
+        and status["last_commit_message"] == "Add app",
+        status,
+    ))
+    (repo / "notes.txt").unlink()
+
+    (repo / "app.py").write_text("print('changed')\n")
+    status = get_git_status(repo)
+    results.append(check(
+        "modified tracked file is uncommitted",
+        status["uncommitted_changes"],
+        status,
+    ))
+    create_commit(repo, "Change app")
+
+    result = create_commit(repo, "Nothing new")
+    results.append(check(
+        "nothing to commit",
+        result == (True, "", "No changes to commit"),
+        result,
+    ))
+
+    (repo / "app.py").unlink()
+    result = create_commit(repo, "Remove app")
+    results.append(check(
+        "deleted file is staged and committed",
+        result[0] and len(result[1]) == 40 and tracked_files(repo) == [],
+        result,
+    ))
+
+    anonymous = make_repo(tmp / "pygit2_no_identity")
+    git(anonymous, "config", "--unset", "user.name")
+    git(anonymous, "config", "--unset", "user.email")
+    (anonymous / "app.py").write_text("print('hello')\n")
+    result = create_commit(anonymous, "Add app")
+    results.append(check(
+        "missing identity is reported",
+        not result[0] and result[2].startswith("git commit failed:"),
+        result,
+    ))
+
+    # Remotes
+    result = setup_remote(repo, REMOTE_URL)
+    results.append(check(
+        "adds origin",
+        result == (True, f"Remote 'origin' configured successfully: {REMOTE_URL}"),
+        result,
+    ))
+
+    result = setup_remote(repo, REMOTE_URL)
+    results.append(check(
+        "origin already set to the same URL",
+        result == (True, f"Remote 'origin' already set to {REMOTE_URL}"),
+        result,
+    ))
+
+    result = setup_remote(repo, "https://github.com/user/other.git")
+    results.append(check(
+        "origin already set to a different URL",
+        result == (False, f"Remote 'origin' already exists with different URL: {REMOTE_URL}"),
+        result,
+    ))
+
+    return results.count(True), results.count(False)
+
+
+def main():
+    print("=" * 70)
+    print("  GIT OPERATIONS TESTS")
+    print("=" * 70)
+
+    if os.name == "nt":
+        print("\n  SKIPPED: the batched shell scripts are not used on Windows")
+        return 0
+
+    # Exercise the shell scripts even if the pygit2 backend is enabled, and
+    # keep the user's git config (identity, default branch) out of the tests
+    git_operations.USE_PYGIT2 = False
+    os.environ["GIT_CONFIG_GLOBAL"] = os.devnull
+    os.environ["GIT_CONFIG_NOSYSTEM"] = "1"
+
+    passed = 0
+    failed = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+
+        # Test status
+        status_passed, status_failed = test_get_git_status(tmp_path)
+        passed += status_passed
+        failed += status_failed
+
+        # Test concurrent status checks
+        many_passed, many_failed = test_get_git_status_many(tmp_path)
+        passed += many_passed
+        failed += many_failed
+
+        # Test remote setup
+        remote_passed, remote_failed = test_setup_remote_and_probe(tmp_path)
+        passed += remote_passed
+        failed += remote_failed
+
+        # Test batch remote setup
+        batch_passed, batch_failed = test_setup_remote_many(tmp_path)
+        passed += batch_passed
+        failed += batch_failed
+
+        # Test commits
+        commit_passed, commit_failed = test_create_commit(tmp_path)
+        passed += commit_passed
+        failed += commit_failed
+
+        # Test the pygit2 backend when it is installed; point libgit2 at an
+        # empty config directory so no user-level identity leaks in
+        if pygit2 is not None:
+            empty_config = tmp_path / "empty_config"
+            empty_config.mkdir()
+            for level in (
+                pygit2.enums.ConfigLevel.GLOBAL,
+                pygit2.enums.ConfigLevel.XDG,
+                pygit2.enums.ConfigLevel.SYSTEM,
+            ):
+                pygit2.settings.search_path[level] = str(empty_config)
+
+            git_operations.pygit2 = pygit2
+            git_operations.USE_PYGIT2 = True
+            try:
+                pygit2_passed, pygit2_failed = test_pygit2_backend(tmp_path)
+            finally:
+                git_operations.USE_PYGIT2 = False
+            passed += pygit2_passed
+            failed += pygit2_failed
+        else:
+            print("\n  SKIPPED: pygit2 backend tests (pygit2 not installed)")
+
+    # Summary
+    print("\n" + "-" * 70)
+    print(f"  Results: {passed} passed, {failed} failed")
+    print("-" * 70)
+
+    if failed == 0:
+        print("\n  ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n  {failed} TEST(S) FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())